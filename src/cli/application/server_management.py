@@ -1,7 +1,10 @@
 """Use cases for server management."""
 
+import socket
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -14,6 +17,13 @@ from ..domain.repositories import (
     ServerInstanceRepository,
 )
 
+# Upper bound on how long start waits for a new server to accept connections
+STARTUP_TIMEOUT = 10.0
+STARTUP_POLL_INTERVAL = 0.1
+
+# Upper bound on servers terminated in parallel by a single stop request
+MAX_STOP_WORKERS = 16
+
 
 class StartServerUseCase:
     """Use case for starting a server."""
@@ -120,10 +130,8 @@ class StartServerUseCase:
             cmd, cwd=self.project_root, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE
         )
 
-        # Give it a moment to start
-        import time
-
-        time.sleep(2)
+        # Wait until the server accepts connections or the process exits
+        self._wait_until_ready(process, host, port)
 
         # Check if process started successfully
         if process.poll() is not None:
@@ -134,6 +142,24 @@ class StartServerUseCase:
 
         return process
 
+    @staticmethod
+    def _wait_until_ready(process: subprocess.Popen, host: str, port: int) -> None:
+        """Poll the server port until it accepts a connection.
+
+        Returns as soon as the port is reachable, the process exits, or
+        STARTUP_TIMEOUT elapses, instead of sleeping for a fixed delay.
+        """
+        # Wildcard bind addresses are not connectable; probe loopback instead
+        probe_host = {"0.0.0.0": "127.0.0.1", "::": "::1", "": "127.0.0.1"}.get(host, host)
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+
+        while process.poll() is None and time.monotonic() < deadline:
+            try:
+                with socket.create_connection((probe_host, port), timeout=STARTUP_POLL_INTERVAL):
+                    return
+            except OSError:
+                time.sleep(STARTUP_POLL_INTERVAL)
+
 
 class StopServerUseCase:
     """Use case for stopping a server."""
@@ -166,27 +192,56 @@ class StopServerUseCase:
 
         return self._stop_instance(instance)
 
-    def execute_all(self) -> list[bool]:
-        """Stop all running servers."""
-        instances = self.server_repo.find_all()
-        results = []
+    def execute_for_instances(self, instances: list[ServerInstance]) -> list[bool]:
+        """Stop several instances concurrently.
 
-        for instance in instances:
-            if instance.is_running:
-                results.append(self._stop_instance(instance))
+        Each termination can wait out the graceful shutdown timeout, so the
+        processes are stopped in parallel and the total wait is that of the
+        slowest one. Tracking state is updated afterwards from this thread,
+        as the server repository is not safe for concurrent writes. A failed
+        termination counts as not stopped and does not affect the others.
+        """
+        if not instances:
+            return []
 
-        return results
+        with ThreadPoolExecutor(max_workers=min(len(instances), MAX_STOP_WORKERS)) as executor:
+            outcomes = list(executor.map(self._terminate_instance, instances))
+
+        for instance, success in outcomes:
+            if success:
+                self._mark_stopped(instance)
+
+        return [success for _, success in outcomes]
+
+    def execute_all(self) -> list[bool]:
+        """Stop all running servers."""
+        return self.execute_for_instances([instance for instance in self.server_repo.find_all() if instance.is_running])
 
     def _stop_instance(self, instance: ServerInstance) -> bool:
         """Stop a specific server instance."""
         success = self.process_repo.terminate(instance.pid)
 
         if success:
-            instance.status = ServerStatus.STOPPED
-            self.server_repo.remove(instance)
+            self._mark_stopped(instance)
 
         return success
 
+    def _terminate_instance(self, instance: ServerInstance) -> tuple[ServerInstance, bool]:
+        """Terminate an instance's process, reporting an error as a failed stop."""
+        try:
+            return instance, self.process_repo.terminate(instance.pid)
+        except Exception as e:
+            import logging
+
+            logger = logging.getLogger("mockctl")
+            logger.warning(f"Failed to stop server with PID {instance.pid}: {e}")
+            return instance, False
+
+    def _mark_stopped(self, instance: ServerInstance) -> None:
+        """Mark a terminated instance as stopped and stop tracking it."""
+        instance.status = ServerStatus.STOPPED
+        self.server_repo.remove(instance)
+
 
 class ListServersUseCase:
     """Use case for listing servers."""
@@ -421,7 +476,7 @@ class SearchLogsUseCase:
             log_files=log_files_searched,
             total_requests=total_requests,
             matched_requests=all_matched_requests,
-            status_code_summary=dict(all_status_summary),
+            status_code_summary=SearchResult.sort_status_summary(all_status_summary),
             search_duration_ms=search_duration_ms,
             since_timestamp=since_timestamp,
         )
@@ -75,6 +75,20 @@ class ServerInstance:
             "log_file": self.log_file,
         }
 
+    def to_json_dict(self) -> dict[str, Any]:
+        """Convert to the dictionary used for CLI JSON output."""
+        return {
+            "config_name": self.config_name,
+            "pid": self.pid,
+            "host": self.host,
+            "port": self.port,
+            "base_url": self.base_url,
+            "docs_url": self.docs_url,
+            "openapi_url": self.openapi_url,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "is_running": self.is_running,
+        }
+
     @classmethod
     def from_dict(cls, data: dict) -> "ServerInstance":
         """Create instance from dictionary."""
@@ -120,10 +134,17 @@ class ServerConfig:
 
     def is_valid(self) -> bool:
         """Check if configuration is valid."""
-        path_exists = self.path.exists()
-        is_directory = self.path.is_dir()
-        files_exist = all(f.exists() for f in self.required_files)
-        return path_exists and is_directory and files_exist
+        # is_dir() is False for a missing path, so it also covers the existence check
+        return self.path.is_dir() and all(f.exists() for f in self.required_files)
+
+    def to_json_dict(self) -> dict[str, Any]:
+        """Convert to the dictionary used for CLI JSON output."""
+        return {
+            "name": self.name,
+            "description": self.description,
+            "is_valid": self.is_valid(),
+            "path": str(self.path),
+        }
 
 
 @dataclass
@@ -383,7 +404,7 @@ class SearchResult:
     log_files: list[str]  # Changed from log_file to log_files to support multiple files
     total_requests: int
     matched_requests: list[RequestResponsePair]
-    status_code_summary: dict[str, int]  # status_code -> count (e.g., "status_200": 3)
+    status_code_summary: dict[str, int]  # status_code -> count (e.g., "status_200": 3), ordered by status code
     search_duration_ms: float
     since_timestamp: Optional[datetime] = None
 
@@ -415,3 +436,12 @@ class SearchResult:
         """Get all requests with a specific status code, sorted by timestamp (newest first)."""
         matching_requests = [req for req in self.matched_requests if req.status_code == status_code]
         return sorted(matching_requests, key=lambda x: x.timestamp, reverse=True)
+
+    @staticmethod
+    def sort_status_summary(status_summary: dict[str, int]) -> dict[str, int]:
+        """Order a status code summary numerically by status code.
+
+        Producers call this once when building a SearchResult so consumers can
+        iterate ``status_code_summary`` in order without sorting it again.
+        """
+        return dict(sorted(status_summary.items(), key=lambda x: int(x[0][7:]) if x[0].startswith("status_") else 0))
@@ -1,13 +1,36 @@
 """File system repository implementations."""
 
 import json
+import os
 from pathlib import Path
 from typing import Optional
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from ..domain.entities import ApiKey, ConfigType, ServerConfig, ServerInstance
 from ..domain.repositories import ServerConfigRepository, ServerInstanceRepository
 
 
+def _load_json_file(path: Path):
+    """Parse a JSON file, using orjson on the raw bytes when available."""
+    if HAS_ORJSON:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _dump_json_bytes(data) -> bytes:
+    """Serialize data as indented JSON bytes, using orjson when available."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
 class FileSystemServerInstanceRepository(ServerInstanceRepository):
     """File system implementation of server instance repository."""
 
@@ -15,6 +38,9 @@ class FileSystemServerInstanceRepository(ServerInstanceRepository):
         self.project_root = project_root
         self.state_dir = project_root / ".server_state"
         self.servers_file = self.state_dir / "servers.json"
+        # Parsed state file contents, keyed on the (inode, mtime_ns, size) they were read at
+        self._servers_cache: Optional[list[dict]] = None
+        self._servers_cache_key: Optional[tuple[int, int, int]] = None
         self._ensure_state_dir()
 
     def _ensure_state_dir(self):
@@ -23,18 +49,55 @@ class FileSystemServerInstanceRepository(ServerInstanceRepository):
         if not self.servers_file.exists():
             self._save_servers([])
 
+    def _state_file_key(self) -> Optional[tuple[int, int, int]]:
+        """Return the state file's (inode, mtime_ns, size), or None if it is missing.
+
+        Writes replace the file, so the inode changes on every save even when
+        mtime granularity hides a same-size write by another process.
+        """
+        try:
+            stat = os.stat(self.servers_file)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
     def _load_servers(self) -> list[dict]:
-        """Load servers from state file."""
+        """Load servers from state file.
+
+        The parsed list is cached and only re-read when the file changes on
+        disk, so repeated lookups within one command cost a single stat.
+        Callers must treat the returned list as read-only.
+        """
+        key = self._state_file_key()
+        if self._servers_cache is not None and key == self._servers_cache_key:
+            return self._servers_cache
+
         try:
-            with open(self.servers_file, "r") as f:
-                return json.load(f)
+            servers_data = _load_json_file(self.servers_file)
         except (FileNotFoundError, json.JSONDecodeError):
-            return []
+            servers_data = []
+
+        self._servers_cache = servers_data
+        self._servers_cache_key = key
+        return servers_data
 
     def _save_servers(self, servers_data: list[dict]):
-        """Save servers to state file."""
-        with open(self.servers_file, "w") as f:
-            json.dump(servers_data, f, indent=2)
+        """Save servers to state file.
+
+        The data is written to a temporary file in the same directory and
+        renamed over the state file, so concurrent readers see either the old
+        or the new contents, never a truncated file.
+        """
+        tmp_file = self.servers_file.with_name(f".{self.servers_file.name}.{os.getpid()}.tmp")
+        try:
+            tmp_file.write_bytes(_dump_json_bytes(servers_data))
+            os.replace(tmp_file, self.servers_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+        self._servers_cache = servers_data
+        self._servers_cache_key = self._state_file_key()
 
     def save(self, instance: ServerInstance) -> None:
         """Save a server instance."""
@@ -83,8 +146,10 @@ class FileSystemServerInstanceRepository(ServerInstanceRepository):
     def remove_by_id(self, pid: int) -> None:
         """Remove server instance by process ID."""
         servers_data = self._load_servers()
-        servers_data = [s for s in servers_data if s.get("pid") != pid]
-        self._save_servers(servers_data)
+        remaining = [s for s in servers_data if s.get("pid") != pid]
+        # Skip the rewrite when the PID was not tracked
+        if len(remaining) != len(servers_data):
+            self._save_servers(remaining)
 
 
 class FileSystemServerConfigRepository(ServerConfigRepository):
@@ -95,22 +160,27 @@ class FileSystemServerConfigRepository(ServerConfigRepository):
 
     def find_all(self) -> list[ServerConfig]:
         """Find all available configurations."""
-        if not self.configs_dir.exists():
+        try:
+            # scandir exposes the entry type from the directory listing, so
+            # plain directories need no extra stat to be recognized
+            with os.scandir(self.configs_dir) as entries:
+                names = sorted(entry.name for entry in entries if entry.is_dir())
+        except (FileNotFoundError, NotADirectoryError):
             return []
 
         configs = []
-        for item in self.configs_dir.iterdir():
-            if item.is_dir():
-                config_type = self._determine_config_type(item.name)
-                description = self._get_config_description(item)
-                configs.append(ServerConfig(name=item.name, path=item, config_type=config_type, description=description))
+        for name in names:
+            config_path = self.configs_dir / name
+            config_type = self._determine_config_type(name)
+            description = self._get_config_description(config_path)
+            configs.append(ServerConfig(name=name, path=config_path, config_type=config_type, description=description))
 
-        return sorted(configs, key=lambda c: c.name)
+        return configs
 
     def find_by_name(self, name: str) -> Optional[ServerConfig]:
         """Find configuration by name."""
         config_path = self.configs_dir / name
-        if not config_path.exists() or not config_path.is_dir():
+        if not config_path.is_dir():
             return None
 
         config_type = self._determine_config_type(name)
@@ -121,8 +191,7 @@ class FileSystemServerConfigRepository(ServerConfigRepository):
     def get_api_key(self, config: ServerConfig) -> Optional[ApiKey]:
         """Get system API key for configuration."""
         try:
-            with open(config.auth_file, "r") as f:
-                auth_data = json.load(f)
+            auth_data = _load_json_file(config.auth_file)
 
             # Look for system API key
             auth_methods = auth_data.get("authentication_methods", {})
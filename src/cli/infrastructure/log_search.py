@@ -188,4 +188,4 @@ class FileSystemLogSearchRepository(LogSearchRepository):
             status_key = f"status_{pair.status_code}"
             status_summary[status_key] += 1
 
-        return dict(status_summary)
+        return SearchResult.sort_status_summary(status_summary)
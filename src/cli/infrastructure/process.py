@@ -1,36 +1,54 @@
 """Process management repository implementation."""
 
+import importlib.util
 import os
 import socket
 import subprocess
 import time
+from collections.abc import Iterator
+from functools import lru_cache
+from types import ModuleType
 from typing import Optional
 
-try:
-    import psutil
+from ..domain.repositories import ProcessRepository
 
-    HAS_PSUTIL = True
-except ImportError:
-    HAS_PSUTIL = False
+# psutil is only imported on first use: on Linux the liveness checks and the
+# process-table walk go through kill(2) and /proc, so most commands never load it
+HAS_PSUTIL = importlib.util.find_spec("psutil") is not None
 
-from ..domain.repositories import ProcessRepository
+
+@lru_cache(maxsize=None)
+def _psutil() -> ModuleType:
+    """Import psutil on first use."""
+    import psutil
+
+    return psutil
 
 
 class SystemProcessRepository(ProcessRepository):
     """System implementation of process repository."""
 
     def exists(self, pid: int) -> bool:
-        """Check if process exists."""
-        if HAS_PSUTIL:
-            return psutil.pid_exists(pid)
-        else:
-            # Fallback using os.kill with signal 0
+        """Check if process exists.
+
+        On POSIX, signal 0 runs the kernel's existence check without sending
+        anything: one kill(2) call instead of psutil reading /proc.
+        """
+        if pid <= 0:
+            return False
+
+        if os.name == "posix" or not HAS_PSUTIL:
             try:
                 os.kill(pid, 0)
                 return True
+            except PermissionError:
+                # The process exists but belongs to another user
+                return True
             except (OSError, ProcessLookupError):
                 return False
 
+        return _psutil().pid_exists(pid)
+
     def find_by_port(self, port: int) -> Optional[int]:
         """Check if a port is in use using socket binding.
 
@@ -53,12 +71,10 @@ class SystemProcessRepository(ProcessRepository):
     def is_mock_server(self, pid: int) -> bool:
         """Check if process is a mock server."""
         if HAS_PSUTIL:
+            psutil = _psutil()
             try:
                 process = psutil.Process(pid)
-                cmdline = " ".join(process.cmdline())
-                uvicorn_match = "uvicorn" in cmdline and "src.main:app" in cmdline
-                python_match = "python" in cmdline and "main.py" in cmdline
-                return uvicorn_match or python_match
+                return self._is_mock_server_cmdline(" ".join(process.cmdline()))
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 return False
         else:
@@ -66,21 +82,26 @@ class SystemProcessRepository(ProcessRepository):
             try:
                 result = subprocess.run(["ps", "-p", str(pid), "-o", "args="], capture_output=True, text=True, timeout=5)
                 if result.returncode == 0:
-                    cmdline = result.stdout.strip()
-                    uvicorn_match = "uvicorn" in cmdline and "src.main:app" in cmdline
-                    python_match = "python" in cmdline and "main.py" in cmdline
-                    return uvicorn_match or python_match
+                    return self._is_mock_server_cmdline(result.stdout.strip())
             except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
                 pass
 
         return False
 
+    @staticmethod
+    def _is_mock_server_cmdline(cmdline: str) -> bool:
+        """Check if a process command line belongs to a mock server."""
+        uvicorn_match = "uvicorn" in cmdline and "src.main:app" in cmdline
+        python_match = "python" in cmdline and "main.py" in cmdline
+        return uvicorn_match or python_match
+
     def terminate(self, pid: int, timeout: int = 10) -> bool:
         """Terminate process gracefully."""
         if not self.exists(pid):
             return True
 
         if HAS_PSUTIL:
+            psutil = _psutil()
             try:
                 process = psutil.Process(pid)
                 process.terminate()
@@ -154,34 +175,56 @@ class SystemProcessRepository(ProcessRepository):
 
     def list_mock_server_processes(self) -> list[dict]:
         """List all mock server processes."""
-        processes = []
+        if HAS_PSUTIL or os.path.isdir("/proc"):
+            return [{"pid": pid, "cmdline": cmdline} for pid, cmdline in self._iter_process_cmdlines() if self._is_mock_server_cmdline(cmdline)]
 
-        if HAS_PSUTIL:
-            for proc in psutil.process_iter(["pid", "cmdline"]):
-                try:
-                    if proc.info["cmdline"]:
-                        cmdline = " ".join(proc.info["cmdline"])
-                        if self.is_mock_server(proc.info["pid"]):
-                            processes.append({"pid": proc.info["pid"], "cmdline": cmdline})
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-        else:
-            # Fallback implementation
-            try:
-                result = subprocess.run(["ps", "aux"], capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    for line in result.stdout.split("\n"):
-                        uvicorn_match = "uvicorn" in line and "src.main:app" in line
-                        python_match = "python" in line and "main.py" in line
-                        if uvicorn_match or python_match:
-                            parts = line.split()
-                            if len(parts) > 1:
-                                try:
-                                    pid = int(parts[1])
-                                    processes.append({"pid": pid, "cmdline": " ".join(parts[10:])})
-                                except ValueError:
-                                    continue
-            except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
-                pass
+        # Fallback implementation
+        processes = []
+        try:
+            result = subprocess.run(["ps", "aux"], capture_output=True, text=True, timeout=10)
+            if result.returncode == 0:
+                for line in result.stdout.split("\n"):
+                    if self._is_mock_server_cmdline(line):
+                        parts = line.split()
+                        if len(parts) > 1:
+                            try:
+                                pid = int(parts[1])
+                                processes.append({"pid": pid, "cmdline": " ".join(parts[10:])})
+                            except ValueError:
+                                continue
+        except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
+            pass
 
         return processes
+
+    @staticmethod
+    def _iter_process_cmdlines() -> Iterator[tuple[int, str]]:
+        """Yield (pid, cmdline) for every readable process in a single table walk.
+
+        The command line comes from the same snapshot, so callers can classify
+        processes without opening each one again. Reads /proc directly when it
+        exists, otherwise uses psutil; the caller checks that one is present.
+        """
+        if os.path.isdir("/proc"):
+            # d_type from scandir lets us skip non-process entries without a stat
+            with os.scandir("/proc") as entries:
+                for entry in entries:
+                    if not entry.name.isdigit() or not entry.is_dir(follow_symlinks=False):
+                        continue
+                    try:
+                        with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                            cmdline = f.read().rstrip(b"\0").replace(b"\0", b" ").decode("utf-8", "replace")
+                    except OSError:
+                        continue
+                    if cmdline:
+                        yield int(entry.name), cmdline
+            return
+
+        psutil = _psutil()
+        for proc in psutil.process_iter(["pid", "cmdline"]):
+            try:
+                cmdline = proc.info["cmdline"]
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            if cmdline:
+                yield proc.info["pid"], " ".join(cmdline)
@@ -1,10 +1,17 @@
 """Command line interface handlers."""
 
 import argparse
+import glob
+import importlib
+import os
 import sys
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 from typing import Any
+from urllib.parse import urljoin, urlsplit
 
 from ..application.server_management import (
     GetConfigurationsUseCase,
@@ -20,15 +27,25 @@ from ..infrastructure.filesystem import (
 )
 from ..infrastructure.log_search import FileSystemLogSearchRepository
 from ..infrastructure.process import SystemProcessRepository
-from .presentation import Colors, Presenter
+from .presentation import Presenter
+
+
+@lru_cache(maxsize=None)
+def _lazy_import(name: str) -> ModuleType:
+    """Import a heavy optional module on first use only.
+
+    Keeps module load cheap for commands that never need it, while repeated
+    calls resolve from the cache instead of re-entering the import machinery.
+    """
+    return importlib.import_module(name)
 
 
 class CommandHandler:
     """Base command handler."""
 
-    def __init__(self, project_root: Path, json_mode: bool = False, no_emoji: bool = False):
+    def __init__(self, project_root: Path, json_mode: bool = False, no_emoji: bool = False, compact: bool = False):
         self.project_root = project_root
-        self.presenter = Presenter(json_mode=json_mode, no_emoji=no_emoji)
+        self.presenter = Presenter(json_mode=json_mode, no_emoji=no_emoji, compact=compact)
 
         # Initialize repositories
         self.server_repo = FileSystemServerInstanceRepository(project_root)
@@ -81,7 +98,7 @@ class StartCommand(CommandHandler):
         self.presenter.show_config_selection(configs)
 
         try:
-            choice = int(input(f"{Colors.CYAN}Select configuration (1-{len(configs)}): {Colors.NC}"))
+            choice = int(input(f"{self.presenter.colors.CYAN}Select configuration (1-{len(configs)}): {self.presenter.colors.NC}"))
             if 1 <= choice <= len(configs):
                 return configs[choice - 1].name
             else:
@@ -135,7 +152,7 @@ class StopCommand(CommandHandler):
         self.presenter.show_server_selection(servers, "stop")
 
         try:
-            choice = int(input(f"{Colors.CYAN}Select server to stop (1-{len(servers)}): {Colors.NC}"))
+            choice = int(input(f"{self.presenter.colors.CYAN}Select server to stop (1-{len(servers)}): {self.presenter.colors.NC}"))
             if 1 <= choice <= len(servers):
                 server = servers[choice - 1]
                 success = self.stop_use_case.execute_by_pid(server.pid)
@@ -254,8 +271,6 @@ class VersionCommand(CommandHandler):
 
     def execute(self, args: argparse.Namespace) -> None:
         """Execute version command."""
-        import tomllib
-
         try:
             # Read version from pyproject.toml
             pyproject_path = self.project_root / "pyproject.toml"
@@ -264,6 +279,7 @@ class VersionCommand(CommandHandler):
                 self.presenter.show_error("pyproject.toml not found")
                 return
 
+            tomllib = _lazy_import("tomllib")
             with open(pyproject_path, "rb") as f:
                 data = tomllib.load(f)
 
@@ -290,12 +306,21 @@ class VersionCommand(CommandHandler):
 class TestCommand(CommandHandler):
     """Handler for test command."""
 
+    # Endpoints probed on every server: (path, description)
+    ENDPOINTS = (
+        ("/", "Root endpoint"),
+        ("/docs", "API documentation"),
+        ("/openapi.json", "OpenAPI schema"),
+    )
+    TIMEOUT_SECONDS = 5
+    # Tracked servers are local, so a connection that is not accepted quickly
+    # means the server is unreachable; fail fast instead of waiting out the read timeout
+    CONNECT_TIMEOUT_SECONDS = 1
+    # Servers probed in parallel when falling back to requests
+    MAX_PROBE_WORKERS = 8
+
     def execute(self, args: argparse.Namespace) -> None:
         """Execute test command."""
-        from urllib.parse import urljoin
-
-        import requests
-
         try:
             # Get all running servers
             servers = self.list_use_case.execute()
@@ -312,43 +337,22 @@ class TestCommand(CommandHandler):
                     return
 
             test_results = []
+            pending_tests: list[dict[str, Any]] = []
 
             for server in servers:
                 base_url = f"http://{server.host}:{server.port}"
                 server_result = {"config": server.config_name, "base_url": base_url, "tests": []}
 
-                # Test endpoints: /, /docs, /openapi.json
-                endpoints = [{"path": "/", "description": "Root endpoint"}, {"path": "/docs", "description": "API documentation"}, {"path": "/openapi.json", "description": "OpenAPI schema"}]
-
-                for endpoint in endpoints:
-                    url = urljoin(base_url + "/", endpoint["path"])
-                    test_result: dict[str, Any] = {"endpoint": endpoint["path"], "url": url, "description": endpoint["description"]}
-
-                    try:
-                        response = requests.get(url, timeout=5)
-                        test_result["status"] = "success"
-                        test_result["status_code"] = response.status_code
-                        test_result["response_time_ms"] = int(response.elapsed.total_seconds() * 1000)
-                        test_result["content_type"] = response.headers.get("content-type", "unknown")
-
-                        if response.status_code >= 400:
-                            test_result["status"] = "warning"
-                            test_result["message"] = f"HTTP {response.status_code}"
-
-                    except requests.exceptions.Timeout:
-                        test_result["status"] = "error"
-                        test_result["message"] = "Request timeout (5s)"
-                    except requests.exceptions.ConnectionError:
-                        test_result["status"] = "error"
-                        test_result["message"] = "Connection failed"
-                    except Exception as e:
-                        test_result["status"] = "error"
-                        test_result["message"] = f"Request failed: {str(e)}"
-
+                for path, description in self.ENDPOINTS:
+                    test_result: dict[str, Any] = {"endpoint": path, "url": urljoin(base_url + "/", path), "description": description}
                     server_result["tests"].append(test_result)
+                    pending_tests.append(test_result)
 
                 test_results.append(server_result)
 
+            # Probe all endpoints of all servers in one batch
+            self._probe_endpoints(pending_tests)
+
             # Display results
             self.presenter.show_test_results(test_results)
 
@@ -362,6 +366,96 @@ class TestCommand(CommandHandler):
             self.presenter.show_error(f"Test command failed: {str(e)}")
             sys.exit(1)
 
+    def _probe_endpoints(self, tests: list[dict[str, Any]]) -> None:
+        """Probe every test URL, filling in each test result in place.
+
+        When httpx is installed all probes share a single event loop and run
+        concurrently; otherwise they fall back to requests, probing the servers
+        in parallel on a thread pool with one Session per server.
+        """
+        try:
+            httpx = _lazy_import("httpx")
+        except ImportError:
+            self._probe_endpoints_sync(tests)
+        else:
+            _lazy_import("asyncio").run(self._probe_endpoints_async(httpx, tests))
+
+    def _probe_endpoints_sync(self, tests: list[dict[str, Any]]) -> None:
+        """Probe endpoints using requests, one worker thread per server.
+
+        Servers are probed in parallel so a slow or unreachable server does
+        not delay the others. Each worker probes its server's endpoints in
+        turn over its own session, which keeps the connection alive between
+        paths (sessions are not shared across threads).
+        """
+        requests = _lazy_import("requests")
+
+        tests_by_server: dict[str, list[dict[str, Any]]] = {}
+        for test_result in tests:
+            tests_by_server.setdefault(urlsplit(test_result["url"]).netloc, []).append(test_result)
+
+        def probe_server(server_tests: list[dict[str, Any]]) -> None:
+            with requests.Session() as session:
+                for test_result in server_tests:
+                    self._probe_endpoint_sync(requests, session, test_result)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(len(tests_by_server), self.MAX_PROBE_WORKERS))) as executor:
+            # Consume the iterator so worker exceptions are raised here
+            list(executor.map(probe_server, tests_by_server.values()))
+
+    def _probe_endpoint_sync(self, requests: ModuleType, session: Any, test_result: dict[str, Any]) -> None:
+        """Probe a single endpoint with the shared requests session."""
+        try:
+            response = session.get(test_result["url"], timeout=(self.CONNECT_TIMEOUT_SECONDS, self.TIMEOUT_SECONDS))
+            self._record_response(test_result, response.status_code, response.elapsed, response.headers)
+        except requests.exceptions.ConnectTimeout:
+            self._record_failure(test_result, f"Connection timeout ({self.CONNECT_TIMEOUT_SECONDS}s)")
+        except requests.exceptions.Timeout:
+            self._record_failure(test_result, f"Request timeout ({self.TIMEOUT_SECONDS}s)")
+        except requests.exceptions.ConnectionError:
+            self._record_failure(test_result, "Connection failed")
+        except Exception as e:
+            self._record_failure(test_result, f"Request failed: {str(e)}")
+
+    async def _probe_endpoints_async(self, httpx: ModuleType, tests: list[dict[str, Any]]) -> None:
+        """Probe all endpoints concurrently over a shared httpx client."""
+        asyncio = _lazy_import("asyncio")
+        timeout = httpx.Timeout(self.TIMEOUT_SECONDS, connect=self.CONNECT_TIMEOUT_SECONDS)
+        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+            await asyncio.gather(*(self._probe_endpoint_async(httpx, client, test_result) for test_result in tests))
+
+    async def _probe_endpoint_async(self, httpx: ModuleType, client: Any, test_result: dict[str, Any]) -> None:
+        """Probe a single endpoint with the shared httpx client."""
+        try:
+            response = await client.get(test_result["url"])
+            self._record_response(test_result, response.status_code, response.elapsed, response.headers)
+        except httpx.ConnectTimeout:
+            self._record_failure(test_result, f"Connection timeout ({self.CONNECT_TIMEOUT_SECONDS}s)")
+        except httpx.TimeoutException:
+            self._record_failure(test_result, f"Request timeout ({self.TIMEOUT_SECONDS}s)")
+        except httpx.TransportError:
+            self._record_failure(test_result, "Connection failed")
+        except Exception as e:
+            self._record_failure(test_result, f"Request failed: {str(e)}")
+
+    @staticmethod
+    def _record_response(test_result: dict[str, Any], status_code: int, elapsed: timedelta, headers: Any) -> None:
+        """Record a received HTTP response on a test result."""
+        test_result["status"] = "success"
+        test_result["status_code"] = status_code
+        test_result["response_time_ms"] = int(elapsed.total_seconds() * 1000)
+        test_result["content_type"] = headers.get("content-type", "unknown")
+
+        if status_code >= 400:
+            test_result["status"] = "warning"
+            test_result["message"] = f"HTTP {status_code}"
+
+    @staticmethod
+    def _record_failure(test_result: dict[str, Any], message: str) -> None:
+        """Record a failed probe on a test result."""
+        test_result["status"] = "error"
+        test_result["message"] = message
+
 
 class CleanUpCommand(CommandHandler):
     """Handler for clean-up command.
@@ -379,20 +473,14 @@ class CleanUpCommand(CommandHandler):
             3. Truncate (or recreate) logs/mockctl.log
             4. Provide JSON or human readable summary
         """
-        import glob
-        import os
-        from datetime import datetime
-
         try:
-            # 1. Stop all running servers
+            # 1. Stop all running servers (reusing the instances already listed)
             servers = self.list_use_case.execute()
-            stopped = []
-            for server in servers:
-                try:
-                    result = self.stop_use_case.execute_by_pid(server.pid)
-                    stopped.append({"config": server.config_name, "pid": server.pid, "stopped": result})
-                except Exception as e:  # pragma: no cover - defensive
-                    stopped.append({"config": server.config_name, "pid": server.pid, "stopped": False, "error": str(e)})
+            try:
+                results = self.stop_use_case.execute_for_instances(servers)
+                stopped = [{"config": server.config_name, "pid": server.pid, "stopped": result} for server, result in zip(servers, results)]
+            except Exception as e:  # pragma: no cover - defensive
+                stopped = [{"config": server.config_name, "pid": server.pid, "stopped": False, "error": str(e)} for server in servers]
 
             # 2. Delete server log files (timestamped) except mockctl.log
             logs_dir = self.project_root / "logs"
@@ -413,20 +501,18 @@ class CleanUpCommand(CommandHandler):
             mockctl_log_path = logs_dir / "mockctl.log"
             mockctl_log_truncated = False
             try:
-                if mockctl_log_path.exists():
-                    with open(mockctl_log_path, "w", encoding="utf-8"):
-                        pass  # truncates
-                    mockctl_log_truncated = True
-                else:
-                    logs_dir.mkdir(exist_ok=True)
-                    mockctl_log_path.touch()
-                    mockctl_log_truncated = True
+                logs_dir.mkdir(exist_ok=True)
+                # Opening for write creates the file if missing and truncates it otherwise
+                with mockctl_log_path.open("w", encoding="utf-8"):
+                    pass
+                mockctl_log_truncated = True
             except OSError as e:  # pragma: no cover - edge case
                 self.presenter.show_warning(f"Could not truncate mockctl.log: {e}")
 
+            timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
             summary = {
                 "action": "clean-up",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "timestamp": timestamp,
                 "stopped_instances": stopped,
                 "deleted_log_files": deleted_logs,
                 "mockctl_log_truncated": mockctl_log_truncated,
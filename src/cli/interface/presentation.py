@@ -1,12 +1,96 @@
 """Presentation layer for displaying information to users."""
 
 import json
-import re
-from datetime import datetime
+import sys
+from bisect import bisect_right
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Optional
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 from ..domain.entities import ServerConfig, ServerInstance
 
+# Code point ranges that cover most Unicode emoji, sorted and non-overlapping.
+# The wide second range takes in dingbats, miscellaneous symbols, variation
+# selectors, enclosed alphanumerics and flags; the last one runs from geometric
+# shapes extended through symbols and pictographs extended-a.
+_EMOJI_RANGES = (
+    (0x2000, 0x206F),  # general punctuation
+    (0x24C2, 0x1F270),  # enclosed alphanumerics through enclosed ideographic supplement
+    (0x1F300, 0x1F6FF),  # pictographs, emoticons, transport & map symbols
+    (0x1F780, 0x1FAFF),  # geometric shapes extended through symbols and pictographs extended-a
+)
+_EMOJI_STARTS = [start for start, _ in _EMOJI_RANGES]
+_EMOJI_ENDS = [end for _, end in _EMOJI_RANGES]
+
+
+class _EmojiTable(dict):
+    """str.translate table that deletes every code point in _EMOJI_RANGES.
+
+    The ranges span over 100k code points, so entries are filled in on first
+    lookup instead of up front: only characters that actually appear in output
+    are ever stored.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        index = bisect_right(_EMOJI_STARTS, codepoint) - 1
+        value = None if index >= 0 and codepoint <= _EMOJI_ENDS[index] else codepoint
+        self[codepoint] = value
+        return value
+
+
+_EMOJI_TABLE = _EmojiTable()
+
+
+def remove_emojis(text: str) -> str:
+    """Remove emojis from text using a translation table.
+
+    Args:
+        text: Input text that may contain emojis
+
+    Returns:
+        Text with emojis removed
+    """
+    if text.isascii():
+        # Every stripped range lies above U+2000, so there is nothing to translate
+        return text.strip()
+    return text.translate(_EMOJI_TABLE).strip()
+
+
+@lru_cache(maxsize=4096)
+def _cached_isoformat(dt: datetime, utcoffset: Optional[timedelta]) -> str:
+    """Cached worker for _format_iso."""
+    return dt.isoformat()
+
+
+@lru_cache(maxsize=4096)
+def _cached_display_format(dt: datetime, utcoffset: Optional[timedelta]) -> str:
+    """Cached worker for _format_display."""
+    # Same text as strftime("%Y-%m-%d %H:%M:%S") without the format interpreter;
+    # the slice drops fractional seconds and any UTC offset
+    return dt.isoformat(" ", "seconds")[:19]
+
+
+def _format_iso(dt: datetime) -> str:
+    """Format a datetime as ISO 8601, memoized for repeated timestamps.
+
+    The UTC offset is part of the cache key because aware datetimes for the
+    same instant compare equal even when their offsets (and output) differ.
+    """
+    return _cached_isoformat(dt, dt.utcoffset())
+
+
+def _format_display(dt: datetime) -> str:
+    """Format a datetime for human-readable output, memoized like _format_iso."""
+    return _cached_display_format(dt, dt.utcoffset())
+
 
 class Colors:
     """Terminal color codes."""
@@ -20,21 +104,49 @@ class Colors:
     NC = "\033[0m"  # No Color
 
 
+class NoColors:
+    """Empty color codes used when output is not a terminal."""
+
+    RED = ""
+    GREEN = ""
+    YELLOW = ""
+    BLUE = ""
+    CYAN = ""
+    MAGENTA = ""
+    NC = ""
+
+
 class Presenter:
     """Handles presentation of information to users."""
 
-    def __init__(self, json_mode: bool = False, no_emoji: bool = False):
+    def __init__(self, json_mode: bool = False, no_emoji: bool = False, compact: bool = False):
         """Initialize presenter with output mode.
 
         Args:
             json_mode: If True, outputs JSON instead of colored text with emojis
             no_emoji: If True, removes emojis from text output (ignored when json_mode is True)
+            compact: If True, JSON is written on a single line without indentation
+                (only applies when json_mode is True)
         """
         self.json_mode = json_mode
+        self.compact = compact
+
         self.no_emoji = no_emoji and not json_mode  # Only apply no_emoji when not in JSON mode
+        # Piped or redirected output gets no ANSI escapes
+        self.colors = Colors if sys.stdout.isatty() else NoColors
+        c = self.colors
+        self._error_prefix = f"{c.RED}❌ Error: "
+        self._warning_prefix = f"{c.YELLOW}⚠️  "
+        self._success_prefix = f"{c.GREEN}✅ "
+        self._info_prefix = f"{c.BLUE}ℹ️  "
+
+        if not self.no_emoji:
+            # Nothing to strip: str() hands back its str argument as is, which skips
+            # a Python-level call and flag check for every formatted line
+            self._format_output = str
 
     def _remove_emojis(self, text: str) -> str:
-        """Remove emojis from text using regex pattern.
+        """Remove emojis from text using a translation table.
 
         Args:
             text: Input text that may contain emojis
@@ -42,35 +154,7 @@ class Presenter:
         Returns:
             Text with emojis removed
         """
-        if not self.no_emoji:
-            return text
-
-        # Comprehensive emoji pattern that matches most Unicode emoji ranges
-        emoji_pattern = re.compile(
-            "["
-            "\U0001f600-\U0001f64f"  # emoticons
-            "\U0001f300-\U0001f5ff"  # symbols & pictographs
-            "\U0001f680-\U0001f6ff"  # transport & map symbols
-            "\U0001f1e0-\U0001f1ff"  # flags (iOS)
-            "\U00002702-\U000027b0"  # dingbats
-            "\U000024c2-\U0001f251"
-            "\U0001f900-\U0001f9ff"  # supplemental symbols and pictographs
-            "\U00002600-\U000026ff"  # miscellaneous symbols
-            "\U00002700-\U000027bf"  # dingbats
-            "\U0001f018-\U0001f270"  # various symbols
-            "\U0001f300-\U0001f6ff"  # miscellaneous symbols and pictographs
-            "\U0001f780-\U0001f7ff"  # geometric shapes extended
-            "\U0001f800-\U0001f8ff"  # supplemental arrows-c
-            "\U0001f900-\U0001f9ff"  # supplemental symbols and pictographs
-            "\U0001fa00-\U0001fa6f"  # chess symbols
-            "\U0001fa70-\U0001faff"  # symbols and pictographs extended-a
-            "\U00002000-\U0000206f"  # general punctuation
-            "\U0000fe00-\U0000fe0f"  # variation selectors
-            "]+",
-            flags=re.UNICODE,
-        )
-
-        return emoji_pattern.sub("", text).strip()
+        return remove_emojis(text)
 
     def _format_output(self, text: str) -> str:
         """Format text output by removing emojis if needed.
@@ -83,20 +167,45 @@ class Presenter:
         """
         return self._remove_emojis(text) if self.no_emoji else text
 
-    def _format_datetime(self, dt: Optional[datetime]) -> Optional[str]:
-        """Format datetime for JSON output."""
-        return dt.isoformat() if dt else None
-
     def _output_json(self, data: dict[str, Any]) -> None:
-        """Output data as JSON."""
-        print(json.dumps(data, indent=2, default=str))
+        """Output data as JSON.
+
+        Callers pre-format non-native values (datetimes as ISO strings, paths
+        as str) so the encoder never falls back to a per-value default hook.
+        """
+        print(self._encode_json(data))
+
+    def _encode_json(self, data: Any) -> str:
+        """Encode a value as JSON text, indented unless compact output was requested.
+
+        Integers beyond 64 bits, which orjson rejects, are encoded by the json
+        module instead.
+        """
+        if HAS_ORJSON:
+            option = orjson.OPT_NON_STR_KEYS if self.compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            try:
+                return orjson.dumps(data, option=option).decode()
+            except TypeError:
+                pass
+        # ensure_ascii=False skips \uXXXX escaping and matches orjson's UTF-8 output
+        if self.compact:
+            return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+    def _status_color(self, status_code: int) -> str:
+        """Get the color for an HTTP status code: green below 400, red otherwise."""
+        return self.colors.GREEN if status_code < 400 else self.colors.RED
+
+    def _emit(self, lines: list[str]) -> None:
+        """Output several lines at once with a single print call."""
+        print("\n".join(lines))
 
     def show_error(self, message: str) -> None:
         """Show error message."""
         if self.json_mode:
             self._output_json({"status": "error", "message": message})
         else:
-            formatted_message = self._format_output(f"{Colors.RED}❌ Error: {message}{Colors.NC}")
+            formatted_message = self._format_output(self._error_prefix + message + self.colors.NC)
             print(formatted_message)
 
     def show_warning(self, message: str) -> None:
@@ -104,7 +213,7 @@ class Presenter:
         if self.json_mode:
             self._output_json({"status": "warning", "message": message})
         else:
-            formatted_message = self._format_output(f"{Colors.YELLOW}⚠️  {message}{Colors.NC}")
+            formatted_message = self._format_output(self._warning_prefix + message + self.colors.NC)
             print(formatted_message)
 
     def show_success(self, message: str) -> None:
@@ -112,7 +221,7 @@ class Presenter:
         if self.json_mode:
             self._output_json({"status": "success", "message": message})
         else:
-            formatted_message = self._format_output(f"{Colors.GREEN}✅ {message}{Colors.NC}")
+            formatted_message = self._format_output(self._success_prefix + message + self.colors.NC)
             print(formatted_message)
 
     def show_info(self, message: str) -> None:
@@ -120,7 +229,7 @@ class Presenter:
         if self.json_mode:
             self._output_json({"status": "info", "message": message})
         else:
-            formatted_message = self._format_output(f"{Colors.BLUE}ℹ️  {message}{Colors.NC}")
+            formatted_message = self._format_output(self._info_prefix + message + self.colors.NC)
             print(formatted_message)
 
     def show_server_started(self, instance: ServerInstance) -> None:
@@ -138,28 +247,31 @@ class Presenter:
                         "base_url": instance.base_url,
                         "docs_url": instance.docs_url,
                         "openapi_url": instance.openapi_url,
-                        "started_at": self._format_datetime(instance.started_at),
+                        "started_at": _format_iso(instance.started_at) if instance.started_at else None,
                     },
                 }
             )
         else:
-            print(self._format_output(f"{Colors.GREEN}🚀 Starting Mock Server with '{instance.config_name}' configuration...{Colors.NC}"))
-            print(self._format_output(f"{Colors.BLUE}🌐 Host: {instance.host}{Colors.NC}"))
-            print(self._format_output(f"{Colors.BLUE}🔌 Port: {instance.port}{Colors.NC}"))
-            print()
-
-            print(self._format_output(f"{Colors.GREEN}✅ Server started successfully!{Colors.NC}"))
-            print()
-            print(self._format_output(f"{Colors.GREEN}📊 Server Information:{Colors.NC}"))
-            print(f"{Colors.BLUE}   Configuration: {instance.config_name}{Colors.NC}")
-            print(f"{Colors.BLUE}   Process ID: {instance.pid}{Colors.NC}")
-            print(f"{Colors.BLUE}   Access the API at: {instance.base_url}{Colors.NC}")
-            print(f"{Colors.BLUE}   Interactive docs: {instance.docs_url}{Colors.NC}")
-            print(f"{Colors.BLUE}   OpenAPI schema: {instance.openapi_url}{Colors.NC}")
-            print()
-            print(self._format_output(f"{Colors.YELLOW}🛑 To stop the server:{Colors.NC}"))
-            print(f"{Colors.CYAN}   mockctl stop{Colors.NC}")
-            print(f"{Colors.CYAN}   mockctl stop --pid {instance.pid}{Colors.NC}")
+            self._emit(
+                [
+                    self._format_output(f"{self.colors.GREEN}🚀 Starting Mock Server with '{instance.config_name}' configuration...{self.colors.NC}"),
+                    self._format_output(f"{self.colors.BLUE}🌐 Host: {instance.host}{self.colors.NC}"),
+                    self._format_output(f"{self.colors.BLUE}🔌 Port: {instance.port}{self.colors.NC}"),
+                    "",
+                    self._format_output(f"{self.colors.GREEN}✅ Server started successfully!{self.colors.NC}"),
+                    "",
+                    self._format_output(f"{self.colors.GREEN}📊 Server Information:{self.colors.NC}"),
+                    f"{self.colors.BLUE}   Configuration: {instance.config_name}{self.colors.NC}",
+                    f"{self.colors.BLUE}   Process ID: {instance.pid}{self.colors.NC}",
+                    f"{self.colors.BLUE}   Access the API at: {instance.base_url}{self.colors.NC}",
+                    f"{self.colors.BLUE}   Interactive docs: {instance.docs_url}{self.colors.NC}",
+                    f"{self.colors.BLUE}   OpenAPI schema: {instance.openapi_url}{self.colors.NC}",
+                    "",
+                    self._format_output(f"{self.colors.YELLOW}🛑 To stop the server:{self.colors.NC}"),
+                    f"{self.colors.CYAN}   mockctl stop{self.colors.NC}",
+                    f"{self.colors.CYAN}   mockctl stop --pid {instance.pid}{self.colors.NC}",
+                ]
+            )
 
     def show_config_selection(self, configs: list[ServerConfig]) -> None:
         """Show configuration selection menu."""
@@ -179,62 +291,55 @@ class Presenter:
                 }
             )
         else:
-            print(self._format_output(f"{Colors.CYAN}📂 Available Configurations:{Colors.NC}"))
-            print()
+            lines = [self._format_output(f"{self.colors.CYAN}📂 Available Configurations:{self.colors.NC}"), ""]
 
+            valid_mark, invalid_mark = self._format_output("✅"), self._format_output("❌")
             for i, config in enumerate(configs, 1):
-                status = "✅" if config.is_valid() else "❌"
-                formatted_status = self._format_output(status)
-                print(f"{Colors.YELLOW}{i}){Colors.NC} {config.name} {formatted_status}")
+                formatted_status = valid_mark if config.is_valid() else invalid_mark
+                lines.append(f"{self.colors.YELLOW}{i}){self.colors.NC} {config.name} {formatted_status}")
                 if config.description:
-                    print(f"   {Colors.BLUE}{config.description}{Colors.NC}")
-            print()
+                    lines.append(f"   {self.colors.BLUE}{config.description}{self.colors.NC}")
+            lines.append("")
+            self._emit(lines)
 
     def show_servers_list(self, servers: list[ServerInstance]) -> None:
         """Show list of servers."""
         if self.json_mode:
-            self._output_json(
-                {
-                    "action": "list_servers",
-                    "count": len(servers),
-                    "servers": [
-                        {
-                            "config_name": server.config_name,
-                            "pid": server.pid,
-                            "host": server.host,
-                            "port": server.port,
-                            "base_url": server.base_url,
-                            "docs_url": server.docs_url,
-                            "openapi_url": server.openapi_url,
-                            "started_at": self._format_datetime(server.started_at),
-                            "is_running": server.is_running,
-                        }
-                        for server in servers
-                    ],
-                }
-            )
+            self._output_json({"action": "list_servers", "count": len(servers), "servers": [server.to_json_dict() for server in servers]})
         else:
-            print(self._format_output(f"{Colors.BLUE}🔍 Scanning for running Mock API Servers...{Colors.NC}"))
-            print()
-            print(self._format_output(f"{Colors.GREEN}📊 Found {len(servers)} tracked server(s):{Colors.NC}"))
-            print()
+            lines = [
+                self._format_output(f"{self.colors.BLUE}🔍 Scanning for running Mock API Servers...{self.colors.NC}"),
+                "",
+                self._format_output(f"{self.colors.GREEN}📊 Found {len(servers)} tracked server(s):{self.colors.NC}"),
+                "",
+            ]
+
+            # Bind loop invariants once: colors and the two possible status labels
+            cyan, nc = self.colors.CYAN, self.colors.NC
+            running_status = self._format_output(f"{self.colors.GREEN}🟢 Running{nc}")
+            stopped_status = self._format_output(f"{self.colors.RED}🔴 Stopped{nc}")
 
             for server in servers:
                 # Format started time
                 started_str = "unknown"
                 if server.started_at:
-                    started_str = server.started_at.strftime("%Y-%m-%d %H:%M:%S")
-
-                status_text = f"{Colors.GREEN}🟢 Running{Colors.NC}" if server.is_running else f"{Colors.RED}🔴 Stopped{Colors.NC}"
-                formatted_status = self._format_output(status_text)
+                    started_str = _format_display(server.started_at)
+
+                formatted_status = running_status if server.is_running else stopped_status
+
+                lines.extend(
+                    (
+                        f"{cyan}Config:{nc} {server.config_name}",
+                        f"{cyan}Status:{nc} {formatted_status}",
+                        f"{cyan}PID:{nc} {server.pid}",
+                        f"{cyan}Address:{nc} {server.base_url}",
+                        f"{cyan}Started:{nc} {started_str}",
+                        f"{cyan}API Docs:{nc} {server.docs_url}",
+                        "",
+                    )
+                )
 
-                print(f"{Colors.CYAN}Config:{Colors.NC} {server.config_name}")
-                print(f"{Colors.CYAN}Status:{Colors.NC} {formatted_status}")
-                print(f"{Colors.CYAN}PID:{Colors.NC} {server.pid}")
-                print(f"{Colors.CYAN}Address:{Colors.NC} {server.base_url}")
-                print(f"{Colors.CYAN}Started:{Colors.NC} {started_str}")
-                print(f"{Colors.CYAN}API Docs:{Colors.NC} {server.docs_url}")
-                print()
+            self._emit(lines)
 
     def show_no_servers(self) -> None:
         """Show no servers found message."""
@@ -248,17 +353,20 @@ class Presenter:
                 }
             )
         else:
-            print(self._format_output(f"{Colors.YELLOW}📭 No tracked servers found{Colors.NC}"))
-            print()
-            print(self._format_output(f"{Colors.BLUE}💡 Looking for untracked mock servers...{Colors.NC}"))
+            self._emit(
+                [
+                    self._format_output(f"{self.colors.YELLOW}📭 No tracked servers found{self.colors.NC}"),
+                    "",
+                    self._format_output(f"{self.colors.BLUE}💡 Looking for untracked mock servers...{self.colors.NC}"),
+                ]
+            )
 
     def show_untracked_processes(self, processes: list[dict]) -> None:
         """Show untracked processes."""
         if self.json_mode:
             self._output_json({"action": "untracked_processes", "count": len(processes), "processes": processes})
-        else:
-            for proc_info in processes:
-                print(f"{Colors.YELLOW}   Untracked: PID {proc_info['pid']} - {proc_info['cmdline']}{Colors.NC}")
+        elif processes:
+            self._emit([f"{self.colors.YELLOW}   Untracked: PID {proc_info['pid']} - {proc_info['cmdline']}{self.colors.NC}" for proc_info in processes])
 
     def show_server_selection(self, servers: list[ServerInstance], action: str) -> None:
         """Show server selection menu."""
@@ -279,9 +387,10 @@ class Presenter:
                 }
             )
         else:
-            print(f"{Colors.CYAN}Multiple servers found. Choose one to {action}:{Colors.NC}")
+            lines = [f"{self.colors.CYAN}Multiple servers found. Choose one to {action}:{self.colors.NC}"]
             for i, server in enumerate(servers, 1):
-                print(f"{Colors.YELLOW}{i}){Colors.NC} {server.config_name} (PID: {server.pid}, Port: {server.port})")
+                lines.append(f"{self.colors.YELLOW}{i}){self.colors.NC} {server.config_name} (PID: {server.pid}, Port: {server.port})")
+            self._emit(lines)
 
     def show_stop_result(self, success: bool, identifier: str) -> None:
         """Show stop operation result."""
@@ -296,14 +405,20 @@ class Presenter:
             )
         else:
             if success:
-                print(self._format_output(f"{Colors.GREEN}✅ Successfully stopped server ({identifier}){Colors.NC}"))
+                print(self._format_output(f"{self.colors.GREEN}✅ Successfully stopped server ({identifier}){self.colors.NC}"))
             else:
-                print(self._format_output(f"{Colors.RED}❌ Failed to stop server ({identifier}){Colors.NC}"))
+                print(self._format_output(f"{self.colors.RED}❌ Failed to stop server ({identifier}){self.colors.NC}"))
 
-    def show_stop_all_results(self, results: list[bool]) -> None:
-        """Show stop all operation results."""
-        successful = sum(results)
-        total = len(results)
+    def show_stop_all_results(self, results: Iterable[bool]) -> None:
+        """Show stop all operation results.
+
+        Args:
+            results: Per-server stop outcomes; any iterable, consumed in a single pass
+        """
+        successful = total = 0
+        for stopped in results:
+            total += 1
+            successful += bool(stopped)
 
         if self.json_mode:
             self._output_json(
@@ -317,11 +432,11 @@ class Presenter:
             )
         else:
             if successful == total:
-                print(self._format_output(f"{Colors.GREEN}✅ Successfully stopped all {total} servers{Colors.NC}"))
+                print(self._format_output(f"{self.colors.GREEN}✅ Successfully stopped all {total} servers{self.colors.NC}"))
             elif successful > 0:
-                print(self._format_output(f"{Colors.YELLOW}⚠️  Stopped {successful} of {total} servers{Colors.NC}"))
+                print(self._format_output(f"{self.colors.YELLOW}⚠️  Stopped {successful} of {total} servers{self.colors.NC}"))
             else:
-                print(self._format_output(f"{Colors.RED}❌ Failed to stop any servers{Colors.NC}"))
+                print(self._format_output(f"{self.colors.RED}❌ Failed to stop any servers{self.colors.NC}"))
 
     def show_config_help(self, configs: list[ServerConfig]) -> None:
         """Show configuration help."""
@@ -329,15 +444,7 @@ class Presenter:
             self._output_json(
                 {
                     "action": "config_help",
-                    "configs": [
-                        {
-                            "name": config.name,
-                            "description": config.description,
-                            "is_valid": config.is_valid(),
-                            "path": config.path,
-                        }
-                        for config in configs
-                    ],
+                    "configs": [config.to_json_dict() for config in configs],
                     "usage_examples": {
                         "start_interactive": "mockctl start",
                         "start_specific": "mockctl start basic",
@@ -352,38 +459,45 @@ class Presenter:
                 }
             )
         else:
-            print(self._format_output(f"{Colors.CYAN}🔧 Mock Server Configuration Management{Colors.NC}"))
-            print(f"{Colors.BLUE}{'=' * 38}{Colors.NC}")
-            print()
-            print(self._format_output(f"{Colors.GREEN}📁 Configuration Structure:{Colors.NC}"))
-            print("   configs/")
-
+            lines = [
+                self._format_output(f"{self.colors.CYAN}🔧 Mock Server Configuration Management{self.colors.NC}"),
+                f"{self.colors.BLUE}{'=' * 38}{self.colors.NC}",
+                "",
+                self._format_output(f"{self.colors.GREEN}📁 Configuration Structure:{self.colors.NC}"),
+                "   configs/",
+            ]
+
+            valid_mark, invalid_mark = self._format_output("✅"), self._format_output("❌")
             for config in configs:
-                status = "✅" if config.is_valid() else "❌"
-                formatted_status = self._format_output(status)
-                print(f"   ├── {config.name}/          {formatted_status} {config.description or ''}")
-
-            print()
-            print("   Each config directory contains:")
-            print("   ├── api.json        # API metadata and settings")
-            print("   ├── auth.json       # Authentication configuration")
-            print("   └── endpoints.json  # Route definitions")
-            print()
-            print(self._format_output(f"{Colors.GREEN}🚀 Starting Servers:{Colors.NC}"))
-            print()
-            print("   # Interactive mode")
-            print(f"   {Colors.CYAN}mockctl start{Colors.NC}")
-            print()
-            print("   # Specific configuration")
-            print(f"   {Colors.CYAN}mockctl start basic{Colors.NC}")
-            print(f"   {Colors.CYAN}mockctl start vmanage --port 8080{Colors.NC}")
-            print()
-            print(self._format_output(f"{Colors.GREEN}🛑 Stopping Servers:{Colors.NC}"))
-            print()
-            print(f"   {Colors.CYAN}mockctl stop{Colors.NC}              # Auto-detect")
-            print(f"   {Colors.CYAN}mockctl stop basic{Colors.NC}        # By config")
-            print(f"   {Colors.CYAN}mockctl stop --port 8080{Colors.NC}  # By port")
-            print(f"   {Colors.CYAN}mockctl stop --all{Colors.NC}        # Stop all")
+                formatted_status = valid_mark if config.is_valid() else invalid_mark
+                lines.append(f"   ├── {config.name}/          {formatted_status} {config.description or ''}")
+
+            lines.extend(
+                (
+                    "",
+                    "   Each config directory contains:",
+                    "   ├── api.json        # API metadata and settings",
+                    "   ├── auth.json       # Authentication configuration",
+                    "   └── endpoints.json  # Route definitions",
+                    "",
+                    self._format_output(f"{self.colors.GREEN}🚀 Starting Servers:{self.colors.NC}"),
+                    "",
+                    "   # Interactive mode",
+                    f"   {self.colors.CYAN}mockctl start{self.colors.NC}",
+                    "",
+                    "   # Specific configuration",
+                    f"   {self.colors.CYAN}mockctl start basic{self.colors.NC}",
+                    f"   {self.colors.CYAN}mockctl start vmanage --port 8080{self.colors.NC}",
+                    "",
+                    self._format_output(f"{self.colors.GREEN}🛑 Stopping Servers:{self.colors.NC}"),
+                    "",
+                    f"   {self.colors.CYAN}mockctl stop{self.colors.NC}              # Auto-detect",
+                    f"   {self.colors.CYAN}mockctl stop basic{self.colors.NC}        # By config",
+                    f"   {self.colors.CYAN}mockctl stop --port 8080{self.colors.NC}  # By port",
+                    f"   {self.colors.CYAN}mockctl stop --all{self.colors.NC}        # Stop all",
+                )
+            )
+            self._emit(lines)
 
     def show_search_results(self, result) -> None:
         """Show search results for requests and responses."""
@@ -393,98 +507,101 @@ class Presenter:
                 "total_requests": result.total_requests,
                 "log_files": result.log_files,
                 "status_code_summary": result.status_code_summary,
-                "matched_requests": [],
+                "matched_requests": self._search_request_records(result),
             }
-
-            for req_resp in result.matched_requests:
-                request_data = {
-                    "timestamp": req_resp.timestamp.isoformat() if req_resp.timestamp else None,
-                    "correlation_id": req_resp.correlation_id,
-                    "method": req_resp.method,
-                    "path": req_resp.path,
-                    "status_code": req_resp.status_code,
-                    "response_time_ms": req_resp.response_time_ms,
-                    "request_body": req_resp.request_body,  # Already parsed as JSON if applicable
-                    "response_body": req_resp.response_body,  # Already parsed as JSON if applicable
-                    "request_headers": req_resp.request_headers,
-                    "response_headers": req_resp.response_headers,
-                }
-                # Add log file source to each request
-                if hasattr(req_resp, "log_file_source"):
-                    request_data["log_file_source"] = req_resp.log_file_source
-
-                json_data["matched_requests"].append(request_data)
-
             self._output_json(json_data)
         else:
             # Text output with colors
-            print(self._format_output(f"\n{Colors.GREEN}🔍 Search Results:{Colors.NC}"))
-            print(f"   Total requests found: {Colors.CYAN}{result.total_requests}{Colors.NC}")
+            lines = [
+                self._format_output(f"\n{self.colors.GREEN}🔍 Search Results:{self.colors.NC}"),
+                f"   Total requests found: {self.colors.CYAN}{result.total_requests}{self.colors.NC}",
+            ]
 
             # Show log files processed
             if result.log_files:
                 if len(result.log_files) == 1:
-                    print(f"   Log file processed: {Colors.BLUE}{result.log_files[0].split('/')[-1]}{Colors.NC}")
+                    lines.append(f"   Log file processed: {self.colors.BLUE}{result.log_files[0].split('/')[-1]}{self.colors.NC}")
                 else:
-                    print(f"   Log files processed ({len(result.log_files)}):")
+                    lines.append(f"   Log files processed ({len(result.log_files)}):")
                     for log_file in result.log_files:
-                        print(f"     • {Colors.BLUE}{log_file.split('/')[-1]}{Colors.NC}")
+                        lines.append(f"     • {self.colors.BLUE}{log_file.split('/')[-1]}{self.colors.NC}")
 
             if result.status_code_summary:
-                print(self._format_output(f"\n{Colors.YELLOW}📊 Status Code Summary:{Colors.NC}"))
-                # Sort status codes numerically by extracting the numeric part
-                sorted_items = sorted(
-                    result.status_code_summary.items(),
-                    key=lambda x: int(x[0][7:]) if x[0].startswith("status_") else 0,
-                )
-
-                for status_key, count in sorted_items:
+                lines.append(self._format_output(f"\n{self.colors.YELLOW}📊 Status Code Summary:{self.colors.NC}"))
+                # The summary is already ordered by status code (see SearchResult.sort_status_summary)
+                for status_key, count in result.status_code_summary.items():
                     # Extract numeric status code for color determination
                     try:
                         status_code = int(status_key[7:]) if status_key.startswith("status_") else 0
-                        color = Colors.GREEN if status_code < 400 else Colors.RED if status_code >= 400 else Colors.YELLOW
+                        color = self._status_color(status_code)
                     except (ValueError, IndexError):
-                        color = Colors.YELLOW
+                        color = self.colors.YELLOW
 
                     # Display using the string key directly (already has "status_" prefix)
-                    print(f"   {color}{status_key}{Colors.NC}: {count} requests")
+                    lines.append(f"   {color}{status_key}{self.colors.NC}: {count} requests")
 
             if result.matched_requests:
-                print(self._format_output(f"\n{Colors.BLUE}📝 Request/Response Details:{Colors.NC}"))
-                for i, req_resp in enumerate(result.matched_requests):
-                    print(f"\n   {Colors.CYAN}[{i+1}]{Colors.NC} {req_resp.timestamp}")
-                    print(f"       Method: {Colors.MAGENTA}{req_resp.method}{Colors.NC}")
-                    print(f"       Path: {req_resp.path}")
-
+                lines.append(self._format_output(f"\n{self.colors.BLUE}📝 Request/Response Details:{self.colors.NC}"))
+                # Show log file source for each request if multiple files were searched
+                show_source = len(result.log_files) > 1
+                # Bind loop invariants once
+                cyan, magenta, blue, nc = self.colors.CYAN, self.colors.MAGENTA, self.colors.BLUE, self.colors.NC
+                status_color_for = self._status_color
+                for i, req_resp in enumerate(result.matched_requests, 1):
                     # Color status code based on value
-                    status_color = Colors.GREEN if req_resp.status_code < 400 else Colors.RED
-                    print(f"       Status: {status_color}{req_resp.status_code}{Colors.NC}")
+                    status_color = status_color_for(req_resp.status_code)
+                    block = [
+                        f"\n   {cyan}[{i}]{nc} {req_resp.timestamp}",
+                        f"       Method: {magenta}{req_resp.method}{nc}",
+                        f"       Path: {req_resp.path}",
+                        f"       Status: {status_color}{req_resp.status_code}{nc}",
+                    ]
 
                     if req_resp.correlation_id:
-                        print(f"       Correlation ID: {req_resp.correlation_id}")
-
+                        block.append(f"       Correlation ID: {req_resp.correlation_id}")
                     if req_resp.response_time_ms:
-                        print(f"       Response Time: {req_resp.response_time_ms:.2f}ms")
-
-                    # Show log file source for each request if multiple files were searched
-                    if len(result.log_files) > 1 and hasattr(req_resp, "log_file_source"):
-                        print(f"       Source: {Colors.BLUE}{req_resp.log_file_source.split('/')[-1]}{Colors.NC}")
-
+                        block.append(f"       Response Time: {req_resp.response_time_ms:.2f}ms")
+                    if show_source and hasattr(req_resp, "log_file_source"):
+                        block.append(f"       Source: {blue}{req_resp.log_file_source.split('/')[-1]}{nc}")
                     if req_resp.request_headers:
-                        print(f"       Request Headers: {req_resp.request_headers}")
-
+                        block.append(f"       Request Headers: {req_resp.request_headers}")
                     if req_resp.response_headers:
-                        print(f"       Response Headers: {req_resp.response_headers}")
-
+                        block.append(f"       Response Headers: {req_resp.response_headers}")
                     if req_resp.request_body:
-                        print(f"       Request: {req_resp.request_body}")
-
+                        block.append(f"       Request: {req_resp.request_body}")
                     if req_resp.response_body:
-                        print(f"       Response: {req_resp.response_body}")
+                        block.append(f"       Response: {req_resp.response_body}")
+
+                    lines.append("\n".join(block))
             else:
-                print(f"\n{Colors.YELLOW}   No matching requests found.{Colors.NC}")
+                lines.append(f"\n{self.colors.YELLOW}   No matching requests found.{self.colors.NC}")
+
+            lines.append("")
+            self._emit(lines)
+
+    def _search_request_records(self, result) -> list[dict[str, Any]]:
+        """Build the JSON record for each matched request of a search result."""
+        records = []
+        for req_resp in result.matched_requests:
+            request_data = {
+                "timestamp": _format_iso(req_resp.timestamp) if req_resp.timestamp else None,
+                "correlation_id": req_resp.correlation_id,
+                "method": req_resp.method,
+                "path": req_resp.path,
+                "status_code": req_resp.status_code,
+                "response_time_ms": req_resp.response_time_ms,
+                "request_body": req_resp.request_body,  # Already parsed as JSON if applicable
+                "response_body": req_resp.response_body,  # Already parsed as JSON if applicable
+                "request_headers": req_resp.request_headers,
+                "response_headers": req_resp.response_headers,
+            }
+            # Add log file source to each request
+            if hasattr(req_resp, "log_file_source"):
+                request_data["log_file_source"] = req_resp.log_file_source
+
+            records.append(request_data)
 
-            print()
+        return records
 
     def show_test_results(self, test_results: list[dict[str, Any]]) -> None:
         """Display test results for server endpoints.
@@ -496,32 +613,34 @@ class Presenter:
             self._output_json({"test_results": test_results})
             return
 
-        print(self._format_output(f"{Colors.BLUE}🧪 Server Endpoint Tests{Colors.NC}\n"))
+        lines = [self._format_output(f"{self.colors.BLUE}🧪 Server Endpoint Tests{self.colors.NC}\n")]
+
+        # Bind loop invariants once: colors, the status code color lookup and the
+        # (color, indicator) shown for each test status, with indicators pre-formatted
+        cyan, nc = self.colors.CYAN, self.colors.NC
+        status_color_for = self._status_color
+        status_display = {
+            "success": (self.colors.GREEN, self._format_output("✅")),
+            "warning": (self.colors.YELLOW, self._format_output("⚠️")),
+        }
+        error_display = (self.colors.RED, self._format_output("❌"))
 
         for server_result in test_results:
             config_name = server_result["config"]
             base_url = server_result["base_url"]
 
-            print(self._format_output(f"{Colors.CYAN}📊 Testing server: {config_name}{Colors.NC}"))
-            print(f"   Base URL: {base_url}")
+            lines.append(self._format_output(f"{cyan}📊 Testing server: {config_name}{nc}"))
+            lines.append(f"   Base URL: {base_url}")
 
             for test in server_result["tests"]:
                 status = test["status"]
                 endpoint = test["endpoint"]
                 description = test["description"]
 
-                # Choose status indicator and color based on result
-                if status == "success":
-                    indicator = "✅"
-                    color = Colors.GREEN
-                elif status == "warning":
-                    indicator = "⚠️"
-                    color = Colors.YELLOW
-                else:  # error
-                    indicator = "❌"
-                    color = Colors.RED
+                # Choose status indicator and color based on result; anything else is an error
+                color, indicator = status_display.get(status, error_display)
 
-                print(f"\n   {self._format_output(indicator)} {color}{endpoint}{Colors.NC} - {description}")
+                lines.append(f"\n   {indicator} {color}{endpoint}{nc} - {description}")
 
                 if status in ["success", "warning"]:
                     status_code = test.get("status_code")
@@ -529,17 +648,19 @@ class Presenter:
                     content_type = test.get("content_type", "unknown")
 
                     if status_code is not None:
-                        status_color = Colors.GREEN if status_code < 400 else Colors.RED
-                        print(f"      Status: {status_color}{status_code}{Colors.NC}")
+                        status_color = status_color_for(status_code)
+                        lines.append(f"      Status: {status_color}{status_code}{nc}")
 
                     if response_time is not None:
-                        print(f"      Response time: {response_time}ms")
+                        lines.append(f"      Response time: {response_time}ms")
 
-                    print(f"      Content type: {content_type}")
+                    lines.append(f"      Content type: {content_type}")
 
                 if "message" in test:
-                    print(f"      {color}Error: {test['message']}{Colors.NC}")
+                    lines.append(f"      {color}Error: {test['message']}{nc}")
+
+                lines.append(f"      URL: {test['url']}")
 
-                print(f"      URL: {test['url']}")
+            lines.append("")  # Extra spacing between servers
 
-            print()  # Extra spacing between servers
+        self._emit(lines)
@@ -7,6 +7,7 @@ Provides endpoints to view and configure logging settings at runtime.
 import logging
 import logging.handlers
 import os
+from collections import deque
 from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -112,9 +113,17 @@ def add_logging_management_endpoints(
     @router.get("/logging/logs", summary="Get recent log entries")
     async def get_recent_logs(
         lines: int = Query(50, description="Number of recent lines to return", ge=1, le=10000),
+        text_filter: Optional[str] = Query(
+            None, alias="filter", description="Only return lines containing this text"
+        ),
         auth: str = Depends(get_system_auth),
     ):
-        """Get recent log entries from the log file."""
+        """Get recent log entries from the log file.
+
+        With ``filter``, the last ``lines`` matching lines are returned, so
+        clients do not have to download the unfiltered tail and discard most
+        of it.
+        """
         try:
             # Get actual log file path from the active file handler
             log_file_path = None
@@ -136,18 +145,28 @@ def add_logging_management_endpoints(
                 }
 
             try:
+                # Stream the file through a bounded deque so only the requested
+                # tail is held in memory; enumerate yields the total line count
                 with open(log_file_path, "r", encoding="utf-8") as f:
-                    all_lines = f.readlines()
-                    recent_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
-
-                return {
-                    "status": "success",
-                    "data": {
-                        "total_lines": len(all_lines),
-                        "returned_lines": len(recent_lines),
-                        "logs": [line.rstrip("\n") for line in recent_lines],
-                    },
-                }
+                    if text_filter:
+                        recent_lines = deque(maxlen=lines)
+                        total_lines = matched_lines = 0
+                        for total_lines, line in enumerate(f, 1):
+                            if text_filter in line:
+                                matched_lines += 1
+                                recent_lines.append(line)
+                    else:
+                        numbered_lines = deque(enumerate(f, 1), maxlen=lines)
+                        total_lines = numbered_lines[-1][0] if numbered_lines else 0
+                        recent_lines = (line for _, line in numbered_lines)
+
+                logs = [line.rstrip("\n") for line in recent_lines]
+                data = {"total_lines": total_lines, "returned_lines": len(logs), "logs": logs}
+                if text_filter:
+                    data["filter"] = text_filter
+                    data["matched_lines"] = matched_lines
+
+                return {"status": "success", "data": data}
             except FileNotFoundError:
                 return {
                     "status": "success",
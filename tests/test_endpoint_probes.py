@@ -0,0 +1,101 @@
+"""Tests for the endpoint probes of the test command.
+
+Validates, for both the httpx and the requests backend, that:
+- A 200 response is recorded as success
+- A 404 response is recorded as a warning
+- A refused connection is recorded as an error
+"""
+
+import os
+import socket
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Add the src directory to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from cli.interface import commands  # noqa: E402
+
+
+class ProbeHandler(BaseHTTPRequestHandler):
+    """Serves 200 on / and 404 everywhere else."""
+
+    def do_GET(self):
+        status = 200 if self.path == "/" else 404
+        body = b'{"ok": true}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ProbeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def closed_url():
+    # Bind and release a port so nothing is listening on it
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    return f"http://127.0.0.1:{port}"
+
+
+@pytest.fixture(params=["httpx", "requests"])
+def probe_command(request, tmp_path, monkeypatch):
+    if request.param == "httpx":
+        pytest.importorskip("httpx")
+    else:
+        lazy_import = commands._lazy_import
+
+        def without_httpx(name):
+            if name == "httpx":
+                raise ImportError("httpx disabled for this test")
+            return lazy_import(name)
+
+        monkeypatch.setattr(commands, "_lazy_import", without_httpx)
+        # Fail loudly if the async path were still taken
+        monkeypatch.setattr(commands.TestCommand, "_probe_endpoints_async", None)
+
+    return commands.TestCommand(tmp_path, json_mode=True)
+
+
+def test_probe_endpoints_records_each_outcome(probe_command, server_url, closed_url):
+    tests = [
+        {"url": f"{server_url}/"},
+        {"url": f"{server_url}/missing"},
+        {"url": f"{closed_url}/"},
+    ]
+
+    probe_command._probe_endpoints(tests)
+
+    ok, missing, refused = tests
+    assert ok["status"] == "success"
+    assert ok["status_code"] == 200
+    assert ok["content_type"] == "application/json"
+    assert ok["response_time_ms"] >= 0
+    assert "message" not in ok
+
+    assert missing["status"] == "warning"
+    assert missing["status_code"] == 404
+    assert missing["message"] == "HTTP 404"
+
+    assert refused["status"] == "error"
+    assert refused["message"] == "Connection failed"
+    assert "status_code" not in refused
@@ -3,12 +3,21 @@
 Test script to verify log deletion configuration works correctly.
 """
 
+import logging
 import os
+import sys
 import tempfile
 
+import pytest
 from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
 
-from routes.logging_management import add_logging_management_endpoints
+# Add the src directory to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from routes.logging_management import add_logging_management_endpoints  # noqa: E402
+
+LOG_LINES = ["GET /users 200", "POST /users 201", "GET /items 404", "GET /users/1 200", "DELETE /users/1 204"]
 
 
 def test_log_deletion_controls():
@@ -95,6 +104,72 @@ def test_log_deletion_controls():
             os.unlink(temp_log_path)
 
 
+@pytest.fixture
+def logs_client(tmp_path):
+    """Client for the logging endpoints, reading a log file with LOG_LINES."""
+    log_path = tmp_path / "server.log"
+    log_path.write_text("\n".join(LOG_LINES) + "\n", encoding="utf-8")
+
+    # The endpoint reads from the first file handler on the root logger
+    handler = logging.FileHandler(log_path, encoding="utf-8")
+    root_logger = logging.getLogger()
+    root_logger.handlers.insert(0, handler)
+
+    app = FastAPI()
+    add_logging_management_endpoints(app, {"logging": {"enabled": True, "file_path": str(log_path)}})
+    try:
+        yield TestClient(app, headers={"X-API-Key": "test-key-123"})
+    finally:
+        root_logger.removeHandler(handler)
+        handler.close()
+
+
+def test_recent_logs_filter_returns_matching_lines(logs_client):
+    response = logs_client.get("/system/logging/logs", params={"filter": "/users"})
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["logs"] == ["GET /users 200", "POST /users 201", "GET /users/1 200", "DELETE /users/1 204"]
+    assert data["total_lines"] == len(LOG_LINES)
+    assert data["returned_lines"] == 4
+    assert data["filter"] == "/users"
+    assert data["matched_lines"] == 4
+
+
+def test_recent_logs_filter_without_match(logs_client):
+    response = logs_client.get("/system/logging/logs", params={"filter": "PATCH"})
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["logs"] == []
+    assert data["total_lines"] == len(LOG_LINES)
+    assert data["returned_lines"] == 0
+    assert data["matched_lines"] == 0
+
+
+def test_recent_logs_filter_with_lines_limit(logs_client):
+    response = logs_client.get("/system/logging/logs", params={"filter": "/users", "lines": 2})
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    # The limit applies to matching lines, keeping the most recent ones
+    assert data["logs"] == ["GET /users/1 200", "DELETE /users/1 204"]
+    assert data["returned_lines"] == 2
+    assert data["matched_lines"] == 4
+
+
+def test_recent_logs_without_filter_omits_filter_fields(logs_client):
+    response = logs_client.get("/system/logging/logs", params={"lines": 3})
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["logs"] == LOG_LINES[-3:]
+    assert data["total_lines"] == len(LOG_LINES)
+    assert data["returned_lines"] == 3
+    assert "filter" not in data
+    assert "matched_lines" not in data
+
+
 if __name__ == "__main__":
     success = test_log_deletion_controls()
     if success:
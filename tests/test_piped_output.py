@@ -0,0 +1,61 @@
+"""Tests for mockctl output when stdout is not a terminal.
+
+Validates that the error and cancellation messages printed by mockctl itself
+carry no ANSI escapes when output is piped, that message text is passed
+through unchanged, and that emojis are only removed with --no-emoji.
+"""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Runs mockctl with a command whose execute() raises the given exception.
+# Logging setup is replaced so the run does not write logs/mockctl.log.
+DRIVER = """
+import sys
+from src.cli import mockctl
+from src.cli.interface import commands
+
+def fail(self, args):
+    raise {exc}
+
+mockctl.setup_mockctl_logging = lambda: mockctl.logger
+commands.ListCommand.execute = fail
+sys.argv = ["mockctl", *{flags!r}, "list"]
+mockctl.MockServerCLI().main()
+"""
+
+EMOJI_PATTERN = re.compile("[\U0001f300-\U0001faff☀-➿️]")
+
+
+def run_piped(exc: str, flags: list[str]) -> tuple[int, str]:
+    proc = subprocess.run([sys.executable, "-c", DRIVER.format(exc=exc, flags=flags)], stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=PROJECT_ROOT, timeout=10)
+    return proc.returncode, proc.stdout.decode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "exc, expected",
+    [
+        ("RuntimeError(\"Config '東京' not found — see “docs”\")", "Error: Config '東京' not found — see “docs”"),
+        ("KeyboardInterrupt()", "Operation cancelled"),
+    ],
+)
+def test_piped_output_has_no_colors(exc, expected):
+    code, out = run_piped(exc, [])
+    assert code == 1
+    assert expected in out
+    assert "\x1b[" not in out
+    assert EMOJI_PATTERN.search(out)
+
+
+@pytest.mark.parametrize("exc", ['RuntimeError("boom")', "KeyboardInterrupt()"])
+def test_piped_output_with_no_emoji(exc):
+    code, out = run_piped(exc, ["--no-emoji"])
+    assert code == 1
+    assert "\x1b[" not in out
+    assert not EMOJI_PATTERN.search(out)
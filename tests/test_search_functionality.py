@@ -161,6 +161,8 @@ class TestSearchFunctionality(unittest.TestCase):
             self.assertEqual(all_result.total_requests, 3, "Should find all 3 requests")
             self.assertIn("status_200", all_result.status_code_summary, "Should have status_200 status codes")
             self.assertIn("status_404", all_result.status_code_summary, "Should have status_404 status code")
+            summary_keys = list(all_result.status_code_summary)
+            self.assertEqual(summary_keys, sorted(summary_keys, key=lambda k: int(k[7:])), "Status summary should be ordered by status code")
 
             # Test time filtering
             since_time = datetime(2025, 9, 9, 10, 0, 0)  # After the first two requests
@@ -288,6 +290,15 @@ class TestSearchFunctionality(unittest.TestCase):
             self.assertIsNotNone(request_data["request_headers"])
             self.assertIsNotNone(request_data["response_headers"])
 
+        # Test compact JSON output
+        compact_presenter = Presenter(json_mode=True, compact=True)
+        with patch("builtins.print") as mock_print:
+            compact_presenter.show_search_results(result)
+
+            printed_content = mock_print.call_args[0][0]
+            self.assertNotIn("\n", printed_content)
+            self.assertEqual(json.loads(printed_content), json_data)
+
         # Test text output
         text_presenter = Presenter(json_mode=False)
         with patch("builtins.print") as mock_print:
@@ -306,6 +317,23 @@ class TestSearchFunctionality(unittest.TestCase):
 
         print("   ✅ Presenter output format tests passed")
 
+    def test_presenter_json_large_integers(self):
+        """Test JSON output for values orjson cannot encode."""
+        print("🧪 Testing JSON output with integers beyond 64 bits...")
+
+        data = {"request_body": {"id": 2**70}}
+
+        for compact in (False, True):
+            presenter = Presenter(json_mode=True, compact=compact)
+            with patch("builtins.print") as mock_print:
+                presenter._output_json(data)
+
+                printed_content = mock_print.call_args[0][0]
+                self.assertEqual(json.loads(printed_content), data)
+                self.assertEqual("\n" in printed_content, not compact)
+
+        print("   ✅ Large integer JSON tests passed")
+
     def test_error_handling(self):
         """Test error handling in search functionality."""
         print("🧪 Testing error handling...")
@@ -0,0 +1,96 @@
+"""Tests for stopping several servers at once.
+
+Validates that:
+- Every instance gets a termination attempt
+- A termination that raises or fails counts as not stopped
+- Only stopped instances are removed from the server repository
+"""
+
+import os
+import sys
+from typing import Optional
+
+# Add the src directory to Python path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from cli.application.server_management import StopServerUseCase  # noqa: E402
+from cli.domain.entities import ServerInstance  # noqa: E402
+from cli.domain.repositories import (  # noqa: E402
+    ProcessRepository,
+    ServerInstanceRepository,
+)
+
+
+class FakeServerRepository(ServerInstanceRepository):
+    """In-memory server repository."""
+
+    def __init__(self, instances: list[ServerInstance]):
+        self.instances = list(instances)
+
+    def save(self, instance: ServerInstance) -> None:
+        self.instances.append(instance)
+
+    def find_by_id(self, pid: int) -> Optional[ServerInstance]:
+        return next((i for i in self.instances if i.pid == pid), None)
+
+    def find_by_port(self, port: int) -> Optional[ServerInstance]:
+        return next((i for i in self.instances if i.port == port), None)
+
+    def find_by_config(self, config_name: str) -> Optional[ServerInstance]:
+        return next((i for i in self.instances if i.config_name == config_name), None)
+
+    def find_all(self) -> list[ServerInstance]:
+        return list(self.instances)
+
+    def remove(self, instance: ServerInstance) -> None:
+        self.instances.remove(instance)
+
+    def remove_by_id(self, pid: int) -> None:
+        self.instances = [i for i in self.instances if i.pid != pid]
+
+
+class FakeProcessRepository(ProcessRepository):
+    """Process repository whose terminate() outcome is set per PID."""
+
+    def __init__(self, outcomes: dict[int, object]):
+        self.outcomes = outcomes
+        self.terminated: list[int] = []
+
+    def exists(self, pid: int) -> bool:
+        return pid in self.outcomes
+
+    def find_by_port(self, port: int) -> Optional[int]:
+        return None
+
+    def is_mock_server(self, pid: int) -> bool:
+        return True
+
+    def terminate(self, pid: int, timeout: int = 10) -> bool:
+        self.terminated.append(pid)
+        outcome = self.outcomes[pid]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def find_next_available_port(self, start_port: int = 8000) -> int:
+        return start_port
+
+
+def test_execute_for_instances_marks_only_stopped_servers():
+    instances = [ServerInstance(config_name=f"config{pid}", port=8000 + pid, pid=pid) for pid in (1, 2, 3, 4)]
+    server_repo = FakeServerRepository(instances)
+    process_repo = FakeProcessRepository({1: True, 2: RuntimeError("access denied"), 3: False, 4: True})
+
+    results = StopServerUseCase(server_repo, process_repo).execute_for_instances(instances)
+
+    assert results == [True, False, False, True]
+    assert sorted(process_repo.terminated) == [1, 2, 3, 4]
+    assert [i.pid for i in server_repo.find_all()] == [2, 3]
+
+
+def test_execute_for_instances_without_instances():
+    server_repo = FakeServerRepository([])
+    process_repo = FakeProcessRepository({})
+
+    assert StopServerUseCase(server_repo, process_repo).execute_for_instances([]) == []
+    assert process_repo.terminated == []